@@ -1,7 +1,7 @@
 """ Tying the magic together into constructing specific domains """
 
 from functools import partial
-from typing import Callable, Dict, List, Type
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
 
 from gym_gridverse.action import Action
 from gym_gridverse.envs import (
@@ -33,6 +33,122 @@ from gym_gridverse.spaces import (
 from gym_gridverse.state import State
 
 
+def _specialized_combination(
+    functions: List, operator: str, empty_value
+) -> Callable[[State, Action, State], Any]:
+    """Combines per-step functions into a single compiled closure
+
+    The list of functions is known at construction time, so instead of
+    paying generator and `sum`/`any` overhead on every step, the combined
+    call `f0(...) <operator> f1(...) <operator> ...` is unrolled into one
+    function whose operands are bound as default arguments.
+
+    Args:
+        functions (`List`): functions of (state, action, next_state)
+        operator (`str`): binary operator source, e.g. '+' or 'or'
+        empty_value: value returned if `functions` is empty
+
+    Returns:
+        Callable: the combined function
+    """
+
+    if not functions:
+        return lambda state, action, next_state: empty_value
+
+    if len(functions) == 1:
+        return functions[0]
+
+    names = [f'f{i}' for i in range(len(functions))]
+    parameters = ', '.join(f'{name}={name}' for name in names)
+    body = f' {operator} '.join(
+        f'{name}(state, action, next_state)' for name in names
+    )
+    source = (
+        f'def combination(state, action, next_state, *, {parameters}):\n'
+        f'    return {body}\n'
+    )
+
+    namespace = dict(zip(names, functions))
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace['combination']
+
+
+def _specialized_transition_chain(
+    transition_functions: List[transition_fs.TransitionFunction],
+) -> transition_fs.TransitionFunction:
+    """Chains transition functions into a single compiled closure
+
+    Same pattern as `_specialized_combination`: the list is fixed at
+    construction time, so the per-step `for` loop and `partial` indirection
+    of `transition_fs.chain` are unrolled into direct calls.
+
+    Args:
+        transition_functions (`List[transition_fs.TransitionFunction]`):
+            called in order
+
+    Returns:
+        transition_fs.TransitionFunction: the combined transition function
+    """
+
+    if not transition_functions:
+        return lambda state, action, *, rng=None: None
+
+    if len(transition_functions) == 1:
+        return transition_functions[0]
+
+    names = [f'f{i}' for i in range(len(transition_functions))]
+    parameters = ', '.join(f'{name}={name}' for name in names)
+    body = '\n'.join(f'    {name}(state, action, rng=rng)' for name in names)
+    source = (
+        f'def transition(state, action, *, rng=None, {parameters}):\n{body}\n'
+    )
+
+    namespace = dict(zip(names, transition_functions))
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace['transition']
+
+
+_SpaceSpec = Tuple[Shape, Tuple[Type[GridObject], ...], Tuple[Color, ...]]
+
+_state_space_cache: Dict[_SpaceSpec, StateSpace] = {}
+_observation_space_cache: Dict[_SpaceSpec, ObservationSpace] = {}
+
+
+def _shared_state_space(
+    grid_shape: Shape,
+    objects: Sequence[Type[GridObject]],
+    colors: Sequence[Color],
+) -> StateSpace:
+    """Returns the one `StateSpace` instance for this spec
+
+    Spaces are read-only after construction, so environments built from the
+    same (shape, objects, colors) spec can share a single instance and its
+    derived lookup tables.
+    """
+    key = (grid_shape, tuple(objects), tuple(colors))
+    try:
+        return _state_space_cache[key]
+    except KeyError:
+        return _state_space_cache.setdefault(
+            key, StateSpace(grid_shape, objects, colors)
+        )
+
+
+def _shared_observation_space(
+    grid_shape: Shape,
+    objects: Sequence[Type[GridObject]],
+    colors: Sequence[Color],
+) -> ObservationSpace:
+    """`_shared_state_space`, but for `ObservationSpace` instances"""
+    key = (grid_shape, tuple(objects), tuple(colors))
+    try:
+        return _observation_space_cache[key]
+    except KeyError:
+        return _observation_space_cache.setdefault(
+            key, ObservationSpace(grid_shape, objects, colors)
+        )
+
+
 def create_env(
     domain_space: DomainSpace,
     reset: reset_functions.ResetFunction,
@@ -59,10 +175,9 @@ def create_env(
         InnerEnv: GridWorld environment
     """
 
-    # Transitions are applied in order
-    transition = partial(
-        transition_fs.chain, transition_functions=transition_functions
-    )
+    # Transitions are applied in order;  unrolled since the list is fixed at
+    # construction
+    transition = _specialized_transition_chain(transition_functions)
 
     # TODO make more general
     observation = partial(
@@ -70,13 +185,11 @@ def create_env(
         observation_space=domain_space.observation_space,
     )
 
-    # Rewards are additive
-    def reward(state: State, action: Action, next_state: State) -> float:
-        return sum(r(state, action, next_state) for r in rewards)
+    # Rewards are additive;  unrolled since the list is fixed at construction
+    reward = _specialized_combination(rewards, '+', 0.0)
 
-    # Termination is a big or
-    def termination(state: State, action: Action, next_state: State) -> bool:
-        return any(t(state, action, next_state) for t in terminations)
+    # Termination is a big (short-circuiting) or
+    termination = _specialized_combination(terminations, 'or', False)
 
     return GridWorld(
         domain_space, reset, transition, observation, reward, termination
@@ -85,6 +198,7 @@ def create_env(
 
 def plain_navigation_task(
     reset_func: reset_functions.ResetFunction,
+    grid_shape: Optional[Shape] = None,
 ) -> InnerEnv:
     """Creates a basic navigation task
 
@@ -93,6 +207,8 @@ def plain_navigation_task(
 
     Args:
         reset_func (reset_functions.ResetFunction):
+        grid_shape (`Shape`, optional): shape of the grids made by
+            `reset_func`;  probed by running `reset_func` if not given
 
     Returns:
         InnerEnv: GridWorld with basic navigation dynamics
@@ -108,13 +224,17 @@ def plain_navigation_task(
         terminating_functions.reach_goal
     ]
 
-    grid_shape = reset_func().grid.shape  # XXX: we hate this
+    if grid_shape is None:
+        grid_shape = reset_func().grid.shape  # XXX: we hate this
+
     objects = [Wall, Floor, Goal]
     colors = [Color.NONE]
 
-    state_space = StateSpace(grid_shape, objects, colors)
+    state_space = _shared_state_space(grid_shape, objects, colors)
     observation_shape = Shape(7, 7)
-    observation_space = ObservationSpace(observation_shape, objects, colors)
+    observation_space = _shared_observation_space(
+        observation_shape, objects, colors
+    )
 
     # NOTE: here we could limit our actions to original gym interface
     action_space = ActionSpace(list(Action))
@@ -154,13 +274,13 @@ def env_dynamic_obstacle(
         terminating_functions.bump_into_wall,
     ]
 
-    grid_shape = reset_func().grid.shape  # XXX: we hate this
+    grid_shape = reset_functions.grid_shape_for(size + 2, size + 2)
     objects = [Wall, Floor, Goal, MovingObstacle]
     colors = [Color.NONE]
 
-    state_space = StateSpace(grid_shape, objects, colors)
+    state_space = _shared_state_space(grid_shape, objects, colors)
     # TODO: hard-coded observation shape
-    observation_space = ObservationSpace(Shape(7, 7), objects, colors)
+    observation_space = _shared_observation_space(Shape(7, 7), objects, colors)
 
     # NOTE: here we could limit our actions to original gym interface
     action_space = ActionSpace(list(Action))
@@ -185,7 +305,9 @@ def env_empty(size: int, random_pos: bool) -> InnerEnv:
     # +2 size to accommodate the walls
     reset = partial(reset_functions.reset_empty, size + 2, size + 2, random_pos)
 
-    return plain_navigation_task(reset)
+    return plain_navigation_task(
+        reset, reset_functions.grid_shape_for(size + 2, size + 2)
+    )
 
 
 def env_four_room() -> InnerEnv:
@@ -197,7 +319,7 @@ def env_four_room() -> InnerEnv:
 
     reset = partial(reset_functions.reset_rooms, 19, 19, layout=(2, 2))
 
-    return plain_navigation_task(reset)
+    return plain_navigation_task(reset, reset_functions.grid_shape_for(19, 19))
 
 
 def gym_keydoor_env(size: int) -> InnerEnv:
@@ -224,13 +346,15 @@ def gym_keydoor_env(size: int) -> InnerEnv:
         terminating_functions.reach_goal
     ]
 
-    grid_shape = reset().grid.shape  # XXX: we hate this
+    grid_shape = reset_functions.grid_shape_for(size + 2, size + 2)
     objects: List[Type[GridObject]] = [Wall, Floor, Goal, Door, Key]
     colors = [Color.NONE, Color.YELLOW]
     observation_shape = Shape(7, 7)
 
-    state_space = StateSpace(grid_shape, objects, colors)
-    observation_space = ObservationSpace(observation_shape, objects, colors)
+    state_space = _shared_state_space(grid_shape, objects, colors)
+    observation_space = _shared_observation_space(
+        observation_shape, objects, colors
+    )
     action_space = ActionSpace(list(Action))
 
     domain_space = DomainSpace(state_space, action_space, observation_space)
@@ -238,44 +362,66 @@ def gym_keydoor_env(size: int) -> InnerEnv:
     return create_env(domain_space, reset, transitions, rewards, terminations)
 
 
-STRING_TO_GYM_CONSTRUCTOR: Dict[str, Callable[[], InnerEnv]] = {
+EnvConstructorSpec = Tuple[Callable[..., InnerEnv], Tuple, Dict]
+"""(function, args, kwargs) triple which instantiates an `InnerEnv` when applied
+
+Plain triples instead of `functools.partial` objects keep the registry
+trivially picklable for multiprocessing workers and avoid one partial
+allocation per entry at import time.
+"""
+
+STRING_TO_GYM_CONSTRUCTOR: Dict[str, EnvConstructorSpec] = {
     # Empty rooms
-    "Empty-5x5-v0": partial(env_empty, size=5, random_pos=False),
-    "Empty-Random-5x5-v0": partial(env_empty, size=5, random_pos=True),
-    "Empty-6x6-v0": partial(env_empty, size=6, random_pos=False),
-    "Empty-Random-6x6-v0": partial(env_empty, size=6, random_pos=True),
-    "Empty-8x8-v0": partial(env_empty, size=8, random_pos=False),
-    "Empty-16x16-v0": partial(env_empty, size=16, random_pos=False),
+    "Empty-5x5-v0": (env_empty, (), {'size': 5, 'random_pos': False}),
+    "Empty-Random-5x5-v0": (env_empty, (), {'size': 5, 'random_pos': True}),
+    "Empty-6x6-v0": (env_empty, (), {'size': 6, 'random_pos': False}),
+    "Empty-Random-6x6-v0": (env_empty, (), {'size': 6, 'random_pos': True}),
+    "Empty-8x8-v0": (env_empty, (), {'size': 8, 'random_pos': False}),
+    "Empty-16x16-v0": (env_empty, (), {'size': 16, 'random_pos': False}),
     # 4 rooms
-    "FourRooms-v0": partial(env_four_room),
+    "FourRooms-v0": (env_four_room, (), {}),
     # Dynamic obstacle environments
-    "Dynamic-Obstacles-5x5-v0": partial(
-        env_dynamic_obstacle, size=5, random_pos=False, num_obstacles=2
+    "Dynamic-Obstacles-5x5-v0": (
+        env_dynamic_obstacle,
+        (),
+        {'size': 5, 'random_pos': False, 'num_obstacles': 2},
     ),
-    "Dynamic-Obstacles-Random-5x5-v0": partial(
-        env_dynamic_obstacle, size=5, random_pos=True, num_obstacles=2
+    "Dynamic-Obstacles-Random-5x5-v0": (
+        env_dynamic_obstacle,
+        (),
+        {'size': 5, 'random_pos': True, 'num_obstacles': 2},
     ),
-    "Dynamic-Obstacles-6x6-v0": partial(
-        env_dynamic_obstacle, size=6, random_pos=False, num_obstacles=3
+    "Dynamic-Obstacles-6x6-v0": (
+        env_dynamic_obstacle,
+        (),
+        {'size': 6, 'random_pos': False, 'num_obstacles': 3},
     ),
-    "Dynamic-Obstacles-Random-6x6-v0": partial(
-        env_dynamic_obstacle, size=6, random_pos=True, num_obstacles=3
+    "Dynamic-Obstacles-Random-6x6-v0": (
+        env_dynamic_obstacle,
+        (),
+        {'size': 6, 'random_pos': True, 'num_obstacles': 3},
     ),
-    "Dynamic-Obstacles-8x8-v0": partial(
-        env_dynamic_obstacle, size=8, random_pos=False, num_obstacles=4
+    "Dynamic-Obstacles-8x8-v0": (
+        env_dynamic_obstacle,
+        (),
+        {'size': 8, 'random_pos': False, 'num_obstacles': 4},
     ),
-    "Dynamic-Obstacles-16x16-v0": partial(
-        env_dynamic_obstacle, size=16, random_pos=False, num_obstacles=8
+    "Dynamic-Obstacles-16x16-v0": (
+        env_dynamic_obstacle,
+        (),
+        {'size': 16, 'random_pos': False, 'num_obstacles': 8},
     ),
-    "KeyDoor-5x5-v0": partial(gym_keydoor_env, size=5),
-    "KeyDoor-6x6-v0": partial(gym_keydoor_env, size=6),
-    "KeyDoor-8x8-v0": partial(gym_keydoor_env, size=8),
-    "KeyDoor-16x16-v0": partial(gym_keydoor_env, size=16),
+    "KeyDoor-5x5-v0": (gym_keydoor_env, (), {'size': 5}),
+    "KeyDoor-6x6-v0": (gym_keydoor_env, (), {'size': 6}),
+    "KeyDoor-8x8-v0": (gym_keydoor_env, (), {'size': 8}),
+    "KeyDoor-16x16-v0": (gym_keydoor_env, (), {'size': 16}),
 }
 
 
 def env_from_descr(descr: str) -> InnerEnv:
     try:
-        return STRING_TO_GYM_CONSTRUCTOR[descr]()
+        fn, args, kwargs = STRING_TO_GYM_CONSTRUCTOR[descr]
     except KeyError:
         raise ValueError(f"No environment named {descr} is implemented")
+
+    return fn(*args, **kwargs)
@@ -14,7 +14,7 @@ from gym_gridverse.design import (
     draw_room_grid,
     draw_wall_boundary,
 )
-from gym_gridverse.geometry import Orientation
+from gym_gridverse.geometry import Orientation, Shape
 from gym_gridverse.grid import Grid
 from gym_gridverse.grid_object import (
     Color,
@@ -36,6 +36,23 @@ class ResetFunction(Protocol):
         ...
 
 
+def grid_shape_for(height: int, width: int) -> Shape:
+    """Shape of the grid a reset function will produce
+
+    Cheap alternative to running a reset function once and probing the
+    resulting `State`, for factories which only need the grid shape to
+    construct their spaces.
+
+    Args:
+        height (`int`):
+        width (`int`):
+
+    Returns:
+        Shape:
+    """
+    return Shape(height, width)
+
+
 def reset_empty(
     height: int,
     width: int,
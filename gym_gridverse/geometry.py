@@ -156,6 +156,15 @@ class Position:
     def astuple(self) -> Tuple[int, int]:
         return (self.y, self.x)
 
+    def linear(self, width: int) -> int:
+        """row-major linear index of the position in a grid of `width`"""
+        return self.y * width + self.x
+
+    @staticmethod
+    def from_linear(index: int, width: int) -> Position:
+        """inverse of :py:meth:`linear`"""
+        return Position(index // width, index % width)
+
     def __add__(self, other) -> Position:
         try:
             y, x = other
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Iterable, List, Sequence, Set, Type
 
 import numpy as np
@@ -8,6 +7,12 @@ import numpy as np
 from .geometry import Area, Orientation, Position, PositionOrTuple, Shape
 from .grid_object import Floor, GridObject, Hidden
 
+try:
+    # optional dependency;  used for a faster Grid.__hash__
+    import xxhash
+except ImportError:
+    xxhash = None  # type: ignore
+
 
 class Grid:
     """The state of the environment (minus the agent): a two-dimensional board of objects
@@ -26,9 +31,8 @@ class Grid:
 
         """
         self.shape = Shape(height, width)
-        self._grid = np.array(
-            [[Floor() for _ in range(width)] for _ in range(height)]
-        )
+        # Floor() is an interned flyweight, so the whole grid shares one
+        self._grid = np.full((height, width), Floor(), dtype=object)
 
     @property
     def height(self):
@@ -59,18 +63,35 @@ class Grid:
     def to_objects(self) -> List[List[GridObject]]:
         return self._grid.tolist()
 
+    def copy(self) -> Grid:
+        """returns a structural copy of the grid
+
+        Preallocates the object ndarray and copies the object references
+        into it;  much cheaper than `copy.deepcopy`, which walks the entire
+        object graph.  Safe because grid objects are treated as immutable
+        value types.
+
+        Returns:
+            Grid: New instance with the same object references
+        """
+        grid = Grid.__new__(Grid)
+        grid.shape = self.shape
+        grid._grid = self._grid.copy()
+        return grid
+
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Grid):
             return NotImplemented
 
         if self.shape != other.shape:
             return False
 
-        for pos in self.positions():
-            if self[pos] != other[pos]:
-                return False
-
-        return True
+        # one vectorized sweep over the object arrays, instead of a Python
+        # loop constructing a Position per cell
+        return bool(np.array_equal(self._grid, other._grid))
 
     @property
     def area(self) -> Area:
@@ -156,22 +177,26 @@ class Grid:
         Returns:
             Grid: New instance, sliced appropriately
         """
-        subgrid = Grid(area.height, area.width)
-        grid_copy = deepcopy(self)
-        for pos_to in subgrid.positions():
-            pos_from = pos_to + area.top_left
-
-            try:
-                obj = grid_copy[pos_from]
-            except IndexError:
-                obj = Hidden()
-
-            subgrid[pos_to] = obj
-            # subgrid[pos_to] = (
-            #     np_grid[pos_from.y, pos_from.x]
-            #     if pos_from in self
-            #     else Hidden()
-            # )
+        # this is the per-step observation cropping kernel:  one vectorized
+        # slice of the object array, padded with the Hidden flyweight, with no
+        # deepcopy (`GridWorld.step` copies the state before mutating it, so
+        # sharing object references here is safe)
+        subgrid = Grid.__new__(Grid)
+        subgrid.shape = Shape(area.height, area.width)
+        subgrid._grid = np.full(  # pylint: disable=protected-access
+            (area.height, area.width), Hidden(), dtype=object
+        )
+
+        ymin = max(area.ymin, 0)
+        ymax = min(area.ymax, self.height - 1)
+        xmin = max(area.xmin, 0)
+        xmax = min(area.xmax, self.width - 1)
+
+        if ymin <= ymax and xmin <= xmax:
+            subgrid._grid[  # pylint: disable=protected-access
+                ymin - area.ymin : ymax - area.ymin + 1,
+                xmin - area.xmin : xmax - area.xmin + 1,
+            ] = self._grid[ymin : ymax + 1, xmin : xmax + 1]
 
         return subgrid
 
@@ -199,12 +224,28 @@ class Grid:
             Orientation.E: 1,
             Orientation.W: 3,
         }
-        objects = np.rot90(self._grid, times[orientation]).tolist()
-        objects = deepcopy(objects)
-        return Grid.from_objects(objects)
+        rotated = np.ascontiguousarray(np.rot90(self._grid, times[orientation]))
+
+        grid = Grid.__new__(Grid)
+        grid.shape = Shape(*rotated.shape)
+        grid._grid = rotated  # pylint: disable=protected-access
+        return grid
 
     def __hash__(self):
-        return hash(tuple(map(tuple, self._grid.tolist())))
+        # digest one contiguous buffer of per-cell indices (the same triples
+        # GridObject.__eq__/__hash__ are defined on), instead of hashing a
+        # tuple-of-tuples of objects
+        data = np.array(
+            [
+                (obj.type_index, obj.state_index, obj.color.value)
+                for obj in self._grid.flat
+            ],
+            dtype=np.uint8,
+        ).tobytes()
+
+        return (
+            xxhash.xxh3_64_intdigest(data) if xxhash is not None else hash(data)
+        )
 
     def __repr__(self):
         return f'<{self.__class__.__name__} {self.height}x{self.width} objects={self.to_objects()!r}>'
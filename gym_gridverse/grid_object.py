@@ -86,6 +86,15 @@ class NoneGridObject(GridObject):
     """ object representing the absence of an object """
 
     type_index: int
+    _instance: Optional[NoneGridObject] = None
+
+    # stateless objects are interned flyweights:  every call returns the same
+    # instance, skipping per-cell allocation during resets and observations
+    def __new__(cls) -> NoneGridObject:
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+        return instance
 
     @classmethod
     def can_be_represented_in_state(cls) -> bool:
@@ -126,6 +135,13 @@ class Hidden(GridObject):
     """ object representing an unobservable cell """
 
     type_index: int
+    _instance: Optional[Hidden] = None
+
+    def __new__(cls) -> Hidden:
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+        return instance
 
     @classmethod
     def can_be_represented_in_state(cls) -> bool:
@@ -166,6 +182,13 @@ class Floor(GridObject):
     """ Most basic object in the grid, represents empty cell """
 
     type_index: int
+    _instance: Optional[Floor] = None
+
+    def __new__(cls) -> Floor:
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+        return instance
 
     @classmethod
     def can_be_represented_in_state(cls) -> bool:
@@ -206,6 +229,13 @@ class Wall(GridObject):
     """ The (second) most basic object in the grid: blocking cell """
 
     type_index: int
+    _instance: Optional[Wall] = None
+
+    def __new__(cls) -> Wall:
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+        return instance
 
     @classmethod
     def can_be_represented_in_state(cls) -> bool:
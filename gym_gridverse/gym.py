@@ -1,6 +1,9 @@
+import multiprocessing
+import multiprocessing.connection
 import time
 from functools import partial
-from typing import Callable, Dict, List, Optional
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
 
 import gym
 import numpy as np
@@ -15,25 +18,77 @@ from gym_gridverse.representations.state_representations import (
     create_state_representation,
 )
 
+if TYPE_CHECKING:
+    from gym_gridverse.rendering import GridVerseViewer
+
+
+def _space_dtype(space: Dict[str, np.ndarray]) -> type:
+    """Smallest buffer dtype able to hold every value of the space
+
+    Representation values are small non-negative indices, so `np.uint8`
+    (a quarter of the footprint of int32) fits every registered
+    environment;  int32 remains the fallback for custom domains with
+    larger bounds.
+    """
+    return (
+        np.uint8
+        if all(v.max() <= np.iinfo(np.uint8).max for v in space.values())
+        else np.int32
+    )
+
 
 def outer_space_to_gym_space(space: Dict[str, np.ndarray]) -> gym.spaces.Space:
+    dtype = _space_dtype(space)
+    # scalar low broadcasts internally, avoiding a zeros array per key
     return gym.spaces.Dict(
         {
-            k: gym.spaces.Box(low=np.zeros_like(v), high=v, dtype=np.int)
+            k: gym.spaces.Box(low=0, high=v, dtype=dtype)
             for k, v in space.items()
         }
     )
 
 
+class _FlatObsView:
+    """Flattens dict observations into one preallocated contiguous buffer
+
+    Avoids allocating a fresh array per step;  `convert` copies the
+    representation channels into the same buffer every time.
+    """
+
+    def __init__(self, space: Dict[str, np.ndarray]):
+        dtype = _space_dtype(space)
+        self._keys = list(space)
+        highs = np.concatenate(
+            [space[key].ravel() for key in self._keys]
+        ).astype(dtype)
+        self._buffer: np.ndarray = np.empty(highs.size, dtype=dtype)
+        self.space = gym.spaces.Box(
+            low=np.zeros_like(highs), high=highs, dtype=dtype
+        )
+
+    def convert(self, observation: Dict[str, np.ndarray]) -> np.ndarray:
+        np.concatenate(
+            [observation[key].ravel() for key in self._keys],
+            out=self._buffer,
+        )
+        return self._buffer
+
+
 class GymEnvironment(gym.Env):
     metadata = {
         'render.modes': ['human', 'human_state', 'human_observation'],
         'video.frames_per_second': 50,
     }
 
+    # viewers shared across instances, keyed on (shape, caption);  multiple
+    # envs of the same shape reuse one viewer (and one warmup sleep).  The
+    # refcounts make sure a viewer is only closed once its last holder closes
+    _viewer_cache: Dict[tuple, 'GridVerseViewer'] = {}
+    _viewer_refs: Dict[tuple, int] = {}
+
     # NOTE accepting an environment instance as input is a bad idea because it
     # would need to be instantiated during gym registration
-    def __init__(self, constructor: Callable[[], OuterEnv]):
+    def __init__(self, constructor: Callable[[], OuterEnv], flat: bool = False):
         super().__init__()
         self.outer_env = constructor()
 
@@ -45,22 +100,59 @@ class GymEnvironment(gym.Env):
         self.action_space = gym.spaces.Discrete(
             self.outer_env.action_space.num_actions
         )
-        self.observation_space = (
-            outer_space_to_gym_space(self.outer_env.observation_rep.space)
+        # fixed int -> Action lookup, avoiding a method call per step
+        self._action_lut = tuple(self.outer_env.action_space.actions)
+
+        # bound methods of the wrapped environment, skipping the OuterEnv
+        # attribute lookups on the per-step path
+        self._inner_env = self.outer_env.inner_env
+        self._fast_reset = self._inner_env.reset
+        self._fast_step = self._inner_env.step
+        self._convert = (
+            self.outer_env.observation_rep.convert
             if self.outer_env.observation_rep is not None
             else None
         )
 
+        self._flat = flat
+        self._obs_scratch = self._make_obs_scratch()
+        self._flat_obs_view: Optional[_FlatObsView] = None
+        if flat and self.outer_env.observation_rep is not None:
+            self._flat_obs_view = _FlatObsView(
+                self.outer_env.observation_rep.space
+            )
+            self.observation_space = self._flat_obs_view.space
+        else:
+            self.observation_space = (
+                outer_space_to_gym_space(self.outer_env.observation_rep.space)
+                if self.outer_env.observation_rep is not None
+                else None
+            )
+
         # self._state_viewer: Optional[GridVerseViewer] = None
         # self._observation_viewer: Optional[GridVerseViewer] = None
         self._state_viewer = None
+        self._state_viewer_key: Optional[tuple] = None
         self._observation_viewer = None
+        self._observation_viewer_key: Optional[tuple] = None
 
     def seed(self, seed: Optional[int] = None) -> List[int]:
         actual_seed = seeding.create_seed(seed)
         self.outer_env.inner_env.set_seed(actual_seed)
         return [actual_seed]
 
+    def _make_obs_scratch(self) -> Optional[Dict[str, np.ndarray]]:
+        """Preallocates the observation buffers reused across steps"""
+        if self.outer_env.observation_rep is None:
+            return None
+
+        space = self.outer_env.observation_rep.space
+        dtype = _space_dtype(space)
+        return {
+            key: np.zeros(value.shape, dtype=dtype)
+            for key, value in space.items()
+        }
+
     def set_state_representation(self, name: str):
         """Change underlying state representation"""
         self.outer_env.state_rep = create_state_representation(
@@ -75,9 +167,17 @@ class GymEnvironment(gym.Env):
         self.outer_env.observation_rep = create_observation_representation(
             name, self.outer_env.inner_env.observation_space
         )
-        self.observation_space = outer_space_to_gym_space(
-            self.outer_env.observation_rep.space
-        )
+        self._convert = self.outer_env.observation_rep.convert
+        self._obs_scratch = self._make_obs_scratch()
+        if self._flat:
+            self._flat_obs_view = _FlatObsView(
+                self.outer_env.observation_rep.space
+            )
+            self.observation_space = self._flat_obs_view.space
+        else:
+            self.observation_space = outer_space_to_gym_space(
+                self.outer_env.observation_rep.space
+            )
 
     @classmethod
     def from_environment(cls, env: OuterEnv):
@@ -88,16 +188,27 @@ class GymEnvironment(gym.Env):
         return self.outer_env.state
 
     @property
-    def observation(self) -> Dict[str, np.ndarray]:
-        return self.outer_env.observation
+    def observation(self) -> Union[Dict[str, np.ndarray], np.ndarray]:
+        # the same preallocated buffers are reused every call;  callers who
+        # need to retain an observation across steps should copy it
+        observation = (
+            self._convert(self._inner_env.observation, out=self._obs_scratch)
+            if self._obs_scratch is not None
+            else self.outer_env.observation
+        )
+        return (
+            self._flat_obs_view.convert(observation)
+            if self._flat_obs_view is not None
+            else observation
+        )
 
-    def reset(self) -> Dict[str, np.ndarray]:
-        self.outer_env.reset()
+    def reset(self) -> Union[Dict[str, np.ndarray], np.ndarray]:
+        self._fast_reset()
         return self.observation
 
     def step(self, action: int):
-        action_ = self.outer_env.action_space.int_to_action(action)
-        reward, done = self.outer_env.step(action_)
+        action_ = self._action_lut[action]
+        reward, done = self._fast_step(action_)
         return self.observation, reward, done, {}
 
     def render(self, mode='human'):
@@ -117,59 +228,362 @@ class GymEnvironment(gym.Env):
         if mode in ['human', 'human_state']:
 
             if self._state_viewer is None:
-                self._state_viewer = GridVerseViewer(
-                    self.outer_env.inner_env.state_space.grid_shape,
-                    caption='State',
-                )
+                shape = self.outer_env.inner_env.state_space.grid_shape
+                key = ((shape.height, shape.width), 'State')
+                self._state_viewer = type(self)._viewer_cache.get(key)
+                self._state_viewer_key = key
 
-                # without sleep the first frame could be black
-                time.sleep(0.05)
+                if self._state_viewer is None:
+                    self._state_viewer = GridVerseViewer(shape, caption='State')
+                    type(self)._viewer_cache[key] = self._state_viewer
+
+                    # without sleep the first frame could be black
+                    time.sleep(0.05)
+
+                refs = type(self)._viewer_refs
+                refs[key] = refs.get(key, 0) + 1
 
             self._state_viewer.render(self.outer_env.inner_env.state)
 
         if mode in ['human', 'human_observation']:
 
             if self._observation_viewer is None:
-                self._observation_viewer = GridVerseViewer(
-                    self.outer_env.inner_env.observation_space.grid_shape,
-                    caption='Observation',
-                )
+                shape = self.outer_env.inner_env.observation_space.grid_shape
+                key = ((shape.height, shape.width), 'Observation')
+                self._observation_viewer = type(self)._viewer_cache.get(key)
+                self._observation_viewer_key = key
+
+                if self._observation_viewer is None:
+                    self._observation_viewer = GridVerseViewer(
+                        shape, caption='Observation'
+                    )
+                    type(self)._viewer_cache[key] = self._observation_viewer
 
-                # without sleep the first frame could be black
-                time.sleep(0.05)
+                    # without sleep the first frame could be black
+                    time.sleep(0.05)
+
+                refs = type(self)._viewer_refs
+                refs[key] = refs.get(key, 0) + 1
 
             self._observation_viewer.render(
                 self.outer_env.inner_env.observation
             )
 
+    @classmethod
+    def _release_viewer(cls, key: tuple):
+        """Drops one reference to a shared viewer, closing it on the last"""
+        cls._viewer_refs[key] -= 1
+        if cls._viewer_refs[key] == 0:
+            del cls._viewer_refs[key]
+            cls._viewer_cache.pop(key).close()
+
     def close(self):
+        # a shared viewer is only closed (and evicted from the cache) when
+        # its last holder closes;  sibling envs keep rendering to it
         if self._state_viewer is not None:
-            self._state_viewer.close()
+            self._release_viewer(self._state_viewer_key)
             self._state_viewer = None
+            self._state_viewer_key = None
 
         if self._observation_viewer is not None:
-            self._observation_viewer.close()
+            self._release_viewer(self._observation_viewer_key)
             self._observation_viewer = None
+            self._observation_viewer_key = None
 
 
-env_ids = []
+def outer_env_constructor(constructor: Callable[[], InnerEnv]) -> OuterEnv:
+    env = constructor()
+    observation_repr = create_observation_representation(
+        'default', env.observation_space
+    )
+    return OuterEnv(env, state_rep=None, observation_rep=observation_repr)
+
+
+def _make(key: str) -> OuterEnv:
+    """Lazily builds the `OuterEnv` for a registered environment id
+
+    Looks up `factory.STRING_TO_GYM_CONSTRUCTOR` at call time, so that
+    importing this module only records ids and never runs the factories.
+    """
+    return outer_env_constructor(partial(factory.env_from_descr, key))
+
+
+class GridVerseSyncVectorEnv(gym.vector.VectorEnv):
+    """Synchronous vectorized version of :class:`GymEnvironment`
+
+    Owns `num_envs` :class:`OuterEnv` instances and steps them sequentially,
+    writing observations, rewards and dones into preallocated numpy buffers
+    instead of stacking python lists.  Sub-environments which terminate are
+    automatically reset within `step`.
+    """
 
-for key, constructor_ in factory.STRING_TO_GYM_CONSTRUCTOR.items():
+    def __init__(self, constructor: Callable[[], OuterEnv], num_envs: int = 1):
+        self.envs = [constructor() for _ in range(num_envs)]
 
-    def outer_env_constructor(constructor: Callable[[], InnerEnv]) -> OuterEnv:
-        env = constructor()
-        state_repr = None
-        observation_repr = create_observation_representation(
-            'default', env.observation_space
+        observation_space = outer_space_to_gym_space(
+            self.envs[0].observation_rep.space
         )
-        return OuterEnv(
-            env, state_rep=state_repr, observation_rep=observation_repr
+        action_space = gym.spaces.Discrete(
+            self.envs[0].action_space.num_actions
         )
+        super().__init__(num_envs, observation_space, action_space)
 
+        self._action_lut = tuple(self.envs[0].action_space.actions)
+
+        self._observations = {
+            key: np.zeros((num_envs,) + space.shape, dtype=space.dtype)
+            for key, space in observation_space.spaces.items()
+        }
+        self._rewards = np.zeros(num_envs, dtype=np.float32)
+        self._dones = np.zeros(num_envs, dtype=np.bool_)
+        self._actions: Optional[np.ndarray] = None
+
+    def seed(self, seed: Optional[int] = None) -> List[int]:
+        actual_seed = seeding.create_seed(seed)
+        seeds = [actual_seed + i for i in range(self.num_envs)]
+        for env, env_seed in zip(self.envs, seeds):
+            env.inner_env.set_seed(env_seed)
+        return seeds
+
+    def reset_wait(self, seed=None, return_info=False, options=None):
+        for i, env in enumerate(self.envs):
+            env.reset()
+            self._write_observation(i, env.observation)
+        return self._observations
+
+    def step_async(self, actions):
+        self._actions = actions
+
+    def step_wait(self):
+        infos: List[Dict] = []
+        for i, env in enumerate(self.envs):
+            action = self._action_lut[int(self._actions[i])]
+            reward, done = env.step(action)
+
+            info: Dict = {}
+            if done:
+                # autoreset, so that the training loop never needs to;  the
+                # pre-reset observation remains available through the info
+                info['terminal_observation'] = env.observation
+                env.reset()
+
+            self._write_observation(i, env.observation)
+            self._rewards[i] = reward
+            self._dones[i] = done
+            infos.append(info)
+
+        return self._observations, self._rewards, self._dones, infos
+
+    def _write_observation(
+        self, index: int, observation: Dict[str, np.ndarray]
+    ):
+        for key, value in observation.items():
+            # representation values are bounded by the space, so the downcast
+            # into the (possibly uint8) buffers is lossless
+            np.copyto(self._observations[key][index], value, casting='unsafe')
+
+
+def _async_worker(
+    env_key: str,
+    index: int,
+    pipe: multiprocessing.connection.Connection,
+    shm_names: Dict[str, str],
+    observation_shapes: Dict[str, Tuple[int, ...]],
+    observation_dtypes: Dict[str, np.dtype],
+    num_envs: int,
+):
+    """Worker process of :class:`GridVerseAsyncVectorEnv`
+
+    Rebuilds the environment from its factory key (the `partial` chains
+    around `transition_fs.chain` do not survive pickling), then writes its
+    observation slice directly into the shared-memory buffers;  only small
+    scalars travel through the pipe.
+    """
+    env = _make(env_key)
+    action_lut = tuple(env.action_space.actions)
+
+    shms = {key: SharedMemory(name=name) for key, name in shm_names.items()}
+    observations: Dict[str, np.ndarray] = {
+        key: np.ndarray(
+            (num_envs,) + observation_shapes[key],
+            dtype=observation_dtypes[key],
+            buffer=shm.buf,
+        )
+        for key, shm in shms.items()
+    }
+
+    def write_observation():
+        for key, value in env.observation.items():
+            # bounded by the space, so the downcast is lossless
+            np.copyto(observations[key][index], value, casting='unsafe')
+
+    try:
+        while True:
+            command, data = pipe.recv()
+
+            if command == 'reset':
+                env.reset()
+                write_observation()
+                pipe.send(None)
+
+            elif command == 'step':
+                action = action_lut[data]
+                reward, done = env.step(action)
+
+                terminal_observation = None
+                if done:
+                    # the autoreset overwrites the shared-memory slice, so
+                    # the pre-reset observation travels through the pipe
+                    terminal_observation = env.observation
+                    env.reset()
+
+                write_observation()
+                pipe.send((reward, done, terminal_observation))
+
+            elif command == 'seed':
+                env.inner_env.set_seed(data)
+                pipe.send(None)
+
+            elif command == 'close':
+                pipe.send(None)
+                break
+
+    finally:
+        for shm in shms.values():
+            shm.close()
+
+
+class GridVerseAsyncVectorEnv(gym.vector.VectorEnv):
+    """Asynchronous vectorized version of :class:`GymEnvironment`
+
+    Runs each sub-environment in its own process;  workers write
+    observations in-place into shared-memory ndarrays, so only actions,
+    rewards and dones are pickled through the pipes.  Environments are
+    identified by their `factory.STRING_TO_GYM_CONSTRUCTOR` key so that
+    each worker can rebuild the constructor chain on its side of the fork.
+    """
+
+    def __init__(self, env_key: str, num_envs: int = 1):
+        if env_key not in factory.STRING_TO_GYM_CONSTRUCTOR:
+            raise ValueError(f'No environment named {env_key} is implemented')
+
+        template_env = _make(env_key)
+        observation_space = outer_space_to_gym_space(
+            template_env.observation_rep.space
+        )
+        action_space = gym.spaces.Discrete(
+            template_env.action_space.num_actions
+        )
+        super().__init__(num_envs, observation_space, action_space)
+
+        spaces = observation_space.spaces
+        self._shms = {
+            key: SharedMemory(
+                create=True,
+                size=num_envs
+                * int(np.prod(space.shape))
+                * space.dtype.itemsize,
+            )
+            for key, space in spaces.items()
+        }
+        self._observations = {
+            key: np.ndarray(
+                (num_envs,) + space.shape,
+                dtype=space.dtype,
+                buffer=self._shms[key].buf,
+            )
+            for key, space in spaces.items()
+        }
+        self._rewards = np.zeros(num_envs, dtype=np.float32)
+        self._dones = np.zeros(num_envs, dtype=np.bool_)
+
+        shm_names = {key: shm.name for key, shm in self._shms.items()}
+        observation_shapes = {key: space.shape for key, space in spaces.items()}
+        observation_dtypes = {key: space.dtype for key, space in spaces.items()}
+
+        self._pipes = []
+        self._processes = []
+        for index in range(num_envs):
+            pipe, worker_pipe = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_async_worker,
+                args=(
+                    env_key,
+                    index,
+                    worker_pipe,
+                    shm_names,
+                    observation_shapes,
+                    observation_dtypes,
+                    num_envs,
+                ),
+                daemon=True,
+            )
+            process.start()
+            worker_pipe.close()
+            self._pipes.append(pipe)
+            self._processes.append(process)
+
+    def seed(self, seed: Optional[int] = None) -> List[int]:
+        actual_seed = seeding.create_seed(seed)
+        seeds = [actual_seed + i for i in range(self.num_envs)]
+        for pipe, env_seed in zip(self._pipes, seeds):
+            pipe.send(('seed', env_seed))
+        for pipe in self._pipes:
+            pipe.recv()
+        return seeds
+
+    def reset_async(self, seed=None, return_info=False, options=None):
+        for pipe in self._pipes:
+            pipe.send(('reset', None))
+
+    def reset_wait(self, seed=None, return_info=False, options=None):
+        for pipe in self._pipes:
+            pipe.recv()
+        return self._observations
+
+    def step_async(self, actions):
+        for pipe, action in zip(self._pipes, actions):
+            pipe.send(('step', int(action)))
+
+    def step_wait(self):
+        infos: List[Dict] = [{} for _ in range(self.num_envs)]
+        for i, pipe in enumerate(self._pipes):
+            reward, done, terminal_observation = pipe.recv()
+            self._rewards[i] = reward
+            self._dones[i] = done
+            if done:
+                infos[i]['terminal_observation'] = terminal_observation
+
+        return self._observations, self._rewards, self._dones, infos
+
+    def close_extras(self, **kwargs):
+        for pipe in self._pipes:
+            pipe.send(('close', None))
+        for pipe in self._pipes:
+            pipe.recv()
+            pipe.close()
+        for process in self._processes:
+            process.join()
+        for shm in self._shms.values():
+            shm.close()
+            shm.unlink()
+
+
+env_ids = []
+
+for key in factory.STRING_TO_GYM_CONSTRUCTOR:
     env_id = f'GridVerse-{key}'
     gym.register(
         env_id,
         entry_point='gym_gridverse.gym:GymEnvironment',
-        kwargs={'constructor': partial(outer_env_constructor, constructor_)},
+        kwargs={'constructor': partial(_make, key)},
     )
     env_ids.append(env_id)
+
+    vec_env_id = f'GridVerse-{key}'.replace('-v0', '-vec-v0')
+    gym.register(
+        vec_env_id,
+        entry_point='gym_gridverse.gym:GridVerseSyncVectorEnv',
+        kwargs={'constructor': partial(_make, key)},
+    )
+    env_ids.append(vec_env_id)
@@ -5,7 +5,7 @@ from gym_gridverse.agent import Agent
 from gym_gridverse.grid import Grid
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class Observation:
     """An observation is represented by two pieces: a grid and an agent
 
@@ -20,3 +20,16 @@ class Observation:
 
     grid: Grid
     agent: Agent
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
+        if not isinstance(other, Observation):
+            return NotImplemented
+
+        # agent comparison is cheap;  grid equality is one ndarray sweep
+        return self.agent == other.agent and self.grid == other.grid
+
+    def __hash__(self):
+        return hash((self.grid, self.agent))
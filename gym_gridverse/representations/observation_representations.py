@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Optional
 
 import numpy as np
 
@@ -27,6 +27,7 @@ class DefaultObservationRepresentation(ObservationRepresentation):
 
     def __init__(self, observation_space: ObservationSpace):
         self.observation_space = observation_space
+        self._agent_scratch: Optional[np.ndarray] = None
 
     @property
     def space(self) -> Dict[str, np.ndarray]:
@@ -48,17 +49,37 @@ class DefaultObservationRepresentation(ObservationRepresentation):
 
         return space
 
-    def convert(self, o: Observation) -> Dict[str, np.ndarray]:
+    def convert(
+        self,
+        o: Observation,
+        out: Optional[Dict[str, np.ndarray]] = None,
+    ) -> Dict[str, np.ndarray]:
         if not self.observation_space.contains(o):
             raise ValueError('Input observation not contained in space')
 
-        conversion = default_convert(o.grid, o.agent)
+        if out is None:
+            conversion = default_convert(o.grid, o.agent)
 
-        # observaiton does not include the position and orientation returned by
-        # the default implementation
-        conversion['agent'] = conversion['agent'][3:]
+            # observaiton does not include the position and orientation
+            # returned by the default implementation
+            conversion['agent'] = conversion['agent'][3:]
+
+            return conversion
+
+        # the default implementation fills a 6-value agent array of which the
+        # observation only keeps the item part;  convert through a reusable
+        # full-size scratch and copy the relevant slice into `out`
+        if self._agent_scratch is None:
+            self._agent_scratch = np.zeros(6, dtype=out['agent'].dtype)
+
+        default_convert(
+            o.grid,
+            o.agent,
+            out={'grid': out['grid'], 'agent': self._agent_scratch},
+        )
+        np.copyto(out['agent'], self._agent_scratch[3:])
 
-        return conversion
+        return out
 
 
 class NoOverlapObservationRepresentation(ObservationRepresentation):
@@ -88,7 +109,11 @@ class NoOverlapObservationRepresentation(ObservationRepresentation):
             self.observation_space.grid_shape.height,
         )
 
-    def convert(self, o: Observation) -> Dict[str, np.ndarray]:
+    def convert(
+        self,
+        o: Observation,
+        out: Optional[Dict[str, np.ndarray]] = None,
+    ) -> Dict[str, np.ndarray]:
         if not self.observation_space.contains(o):
             raise ValueError('Input observation not contained in space')
 
@@ -96,7 +121,7 @@ class NoOverlapObservationRepresentation(ObservationRepresentation):
         max_state_index = self.observation_space.max_grid_object_status
 
         return no_overlap_convert(
-            o.grid, o.agent, max_type_index, max_state_index
+            o.grid, o.agent, max_type_index, max_state_index, out=out
         )
 
 
@@ -1,5 +1,5 @@
 import abc
-from typing import Dict
+from typing import Dict, Optional
 
 import numpy as np
 
@@ -45,8 +45,16 @@ class ObservationRepresentation(Representation):
     """Base interface for observation representations: enforces `convert`"""
 
     @abc.abstractmethod
-    def convert(self, o: Observation) -> Dict[str, np.ndarray]:
-        """returns observation `o` representation as str -> array dict"""
+    def convert(
+        self,
+        o: Observation,
+        out: Optional[Dict[str, np.ndarray]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """returns observation `o` representation as str -> array dict
+
+        When `out` is given, writes into its preallocated arrays (mirroring
+        numpy's `out=` pattern) and returns it, avoiding per-call allocation.
+        """
 
 
 class GridObjectRepresentation(Representation):
@@ -107,7 +115,11 @@ def default_representation_space(
     return {'grid': grid_array, 'agent': agent_array}
 
 
-def default_convert(grid: Grid, agent: Agent) -> Dict[str, np.ndarray]:
+def default_convert(
+    grid: Grid,
+    agent: Agent,
+    out: Optional[Dict[str, np.ndarray]] = None,
+) -> Dict[str, np.ndarray]:
     """Default naive convertion of a grid and agent
 
     Converts grid to a 6 channel (of height x width) representation of:
@@ -141,56 +153,50 @@ def default_convert(grid: Grid, agent: Agent) -> Dict[str, np.ndarray]:
     Args:
         grid (Grid):
         agent (Agent):
+        out (`Dict[str, np.ndarray]`, optional): preallocated {'grid':
+            (height, width, 6), 'agent': (6,)} arrays to write into
 
     Returns:
         Dict[str, np.ndarray]: {'grid': array, 'state': array}
     """
 
-    agent_obj_array = np.array(
-        [agent.obj.type_index, agent.obj.state_index, agent.obj.color.value]
-    )
-
-    grid_array_object_channels = np.array(
-        [
-            [
-                [
-                    grid[y, x].type_index,
-                    grid[y, x].state_index,
-                    grid[y, x].color.value,
-                ]
-                for x in range(grid.shape.width)
-            ]
-            for y in range(grid.shape.height)
-        ]
-    )
-    none_grid_object = NoneGridObject()
-    grid_array_agent_channels = np.array(
-        [
-            [
-                [
-                    none_grid_object.type_index,  # pylint: disable=no-member
-                    none_grid_object.state_index,
-                    none_grid_object.color.value,
-                ]
-                for x in range(grid.shape.width)
-            ]
-            for y in range(grid.shape.height)
-        ]
-    )
-    grid_array_agent_channels[agent.position.astuple()] = agent_obj_array
-
-    grid_array = np.concatenate(
-        (grid_array_agent_channels, grid_array_object_channels), axis=-1
-    )
+    if out is None:
+        out = {
+            'grid': np.zeros(
+                (grid.shape.height, grid.shape.width, 6), dtype=int
+            ),
+            'agent': np.zeros(6, dtype=int),
+        }
 
-    agent_array = np.concatenate(
-        [
-            [agent.position.y, agent.position.x, agent.orientation.value],
-            agent_obj_array,
-        ]
-    )
+    grid_array = out['grid']
+    agent_array = out['agent']
 
-    return {'grid': grid_array, 'agent': agent_array}
+    none_grid_object = NoneGridObject()
+    # agent channels: none-object everywhere except the agent's position
+    # pylint: disable-next=no-member
+    grid_array[:, :, 0] = none_grid_object.type_index
+    grid_array[:, :, 1] = none_grid_object.state_index
+    grid_array[:, :, 2] = none_grid_object.color.value
+    grid_array[agent.position.y, agent.position.x, 0] = agent.obj.type_index
+    grid_array[agent.position.y, agent.position.x, 1] = agent.obj.state_index
+    grid_array[agent.position.y, agent.position.x, 2] = agent.obj.color.value
+
+    # object channels
+    for y in range(grid.shape.height):
+        for x in range(grid.shape.width):
+            obj = grid[y, x]
+            grid_array[y, x, 3] = obj.type_index
+            grid_array[y, x, 4] = obj.state_index
+            grid_array[y, x, 5] = obj.color.value
+
+    agent_array[0] = agent.position.y
+    agent_array[1] = agent.position.x
+    agent_array[2] = agent.orientation.value
+    agent_array[3] = agent.obj.type_index
+    agent_array[4] = agent.obj.state_index
+    agent_array[5] = agent.obj.color.value
+
+    return out
 
 
 def no_overlap_representation_space(
@@ -250,7 +256,11 @@ def no_overlap_representation_space(
 
 
 def no_overlap_convert(
-    grid: Grid, agent: Agent, max_type_index: int, max_state_index: int
+    grid: Grid,
+    agent: Agent,
+    max_type_index: int,
+    max_state_index: int,
+    out: Optional[Dict[str, np.ndarray]] = None,
 ) -> Dict[str, np.ndarray]:
     """similar to the `default_representation_space`, but ensures no overlap between channels
 
@@ -296,4 +306,11 @@ def no_overlap_convert(
     rep['agent'][1] += max_type_index
     rep['agent'][2] += max_type_index + max_state_index
 
-    return rep
+    if out is None:
+        return rep
+
+    # values are bounded by the space, so the downcast into the (possibly
+    # uint8) buffers is lossless
+    np.copyto(out['grid'], rep['grid'], casting='unsafe')
+    np.copyto(out['agent'], rep['agent'], casting='unsafe')
+    return out
@@ -1,4 +1,6 @@
 """Defines the State class"""
+from __future__ import annotations
+
 from dataclasses import dataclass
 
 from gym_gridverse.agent import Agent
@@ -20,3 +22,17 @@ class State:
 
     grid: Grid
     agent: Agent
+
+    def copy(self) -> State:
+        """returns a structural copy of the state
+
+        Copies the grid via :py:meth:`~gym_gridverse.grid.Grid.copy` and
+        rebuilds the agent, skipping the `copy.deepcopy` machinery.
+
+        Returns:
+            State:
+        """
+        return State(
+            self.grid.copy(),
+            Agent(self.agent.position, self.agent.orientation, self.agent.obj),
+        )
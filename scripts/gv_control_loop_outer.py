@@ -1,10 +1,12 @@
 #!/usr/bin/env python
 import argparse
 import itertools as itt
-import random
 import time
 
+import numpy as np
+
 from gym_gridverse.envs.yaml.factory import factory_env_from_yaml
+from gym_gridverse.gym import GridVerseSyncVectorEnv
 from gym_gridverse.outer_env import OuterEnv
 from gym_gridverse.representations.observation_representations import (
     DefaultObservationRepresentation,
@@ -24,36 +26,34 @@ def print_observation(observation):
 
 
 def main(args):
-    env = make_env(args.path)
-    env.reset()
+    env = GridVerseSyncVectorEnv(lambda: make_env(args.path), num_envs=1)
 
     spf = 1 / args.fps
 
-    for ei in itt.count():
-        print(f'# Episode {ei}')
-        print()
-
-        env.reset()
-        print_observation(env.observation)
-        time.sleep(spf)
+    # hoisted out of the loop:  sampling integers directly avoids rebuilding
+    # action lists and the gym sampling machinery every step
+    num_actions = env.single_action_space.n
+    rng = np.random.default_rng()
 
-        for ti in itt.count():
-            print(f'episode: {ei}')
-            print(f'time: {ti}')
+    observation = env.reset()
+    print_observation(observation)
+    time.sleep(spf)
 
-            action = random.choice(env.action_space.actions)
-            reward, done = env.step(action)
+    # no episode bookkeeping:  terminated sub-environments are automatically
+    # reset inside `step`
+    for ti in itt.count():
+        print(f'time: {ti}')
 
-            print(f'action: {action}')
-            print(f'reward: {reward}')
-            print_observation(env.observation)
-            print(f'done: {done}')
-            print()
+        actions = rng.integers(num_actions, size=1)
+        observation, reward, done, _ = env.step(actions)
 
-            time.sleep(spf)
+        print(f'action: {actions[0]}')
+        print(f'reward: {reward[0]}')
+        print_observation(observation)
+        print(f'done: {done[0]}')
+        print()
 
-            if done:
-                break
+        time.sleep(spf)
 
 
 if __name__ == "__main__":
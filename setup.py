@@ -42,6 +42,7 @@ setup(
     ],
     description="Gridworld domains for fully and partially observable reinforcement learning",
     install_requires=requirements,
+    extras_require={'fast-hash': ['xxhash']},
     license="MIT license",
     long_description=readme + '\n\n' + history,
     long_description_content_type='text/x-rst',
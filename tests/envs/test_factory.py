@@ -1,8 +1,84 @@
 import pytest
 
-from gym_gridverse.envs.factory import env_from_descr
+from gym_gridverse.envs.factory import (
+    _specialized_combination,
+    _specialized_transition_chain,
+    env_from_descr,
+)
 
 
 def test_that_it_errors_for_coverage():
     with pytest.raises(ValueError):
         env_from_descr("blah!")
+
+
+def test_specialized_combination_empty():
+    reward = _specialized_combination([], '+', 0.0)
+    assert reward(None, None, None) == 0.0
+
+    termination = _specialized_combination([], 'or', False)
+    assert termination(None, None, None) is False
+
+
+def test_specialized_combination_single():
+    def reward_function(state, action, next_state):
+        return 1.5
+
+    assert (
+        _specialized_combination([reward_function], '+', 0.0) is reward_function
+    )
+
+
+def test_specialized_combination_additive():
+    rewards = [
+        lambda state, action, next_state: 1.0,
+        lambda state, action, next_state: -2.0,
+        lambda state, action, next_state: 0.25,
+    ]
+    reward = _specialized_combination(rewards, '+', 0.0)
+    assert reward(None, None, None) == -0.75
+
+
+def test_specialized_transition_chain():
+    calls = []
+
+    def transition_a(state, action, *, rng=None):
+        calls.append('a')
+
+    def transition_b(state, action, *, rng=None):
+        calls.append('b')
+
+    assert _specialized_transition_chain([transition_a]) is transition_a
+
+    transition = _specialized_transition_chain([transition_a, transition_b])
+    transition(None, None, rng=None)
+    assert calls == ['a', 'b']
+
+
+def test_shared_spaces():
+    env = env_from_descr("Empty-5x5-v0")
+    other_env = env_from_descr("Empty-5x5-v0")
+
+    assert env.state_space is other_env.state_space
+    assert env.observation_space is other_env.observation_space
+
+    different_env = env_from_descr("Empty-8x8-v0")
+    assert env.state_space is not different_env.state_space
+
+
+def test_specialized_combination_short_circuit():
+    calls = []
+
+    def termination_true(state, action, next_state):
+        calls.append('true')
+        return True
+
+    def termination_false(state, action, next_state):
+        calls.append('false')
+        return False
+
+    termination = _specialized_combination(
+        [termination_true, termination_false], 'or', False
+    )
+    assert termination(None, None, None)
+    assert calls == ['true']
@@ -44,11 +44,12 @@ def test_gym_registration(env_id: str):
 def test_gym_seed(env_id: str, seed: Optional[int]):
     env = gym.make(env_id)
 
+    # observations share the env's reused buffers, so retain explicit copies
     env.seed(seed)
-    observation1 = env.reset()
+    observation1 = {k: v.copy() for k, v in env.reset().items()}
 
     env.seed(seed)
-    observation2 = env.reset()
+    observation2 = {k: v.copy() for k, v in env.reset().items()}
 
     np.testing.assert_equal(observation1, observation2)
 
@@ -63,3 +64,107 @@ def test_gym_control_loop():
 
         if done:
             env.reset()
+
+
+@pytest.mark.parametrize(
+    'env_id',
+    [
+        'GridVerse-Empty-5x5-vec-v0',
+        'GridVerse-FourRooms-vec-v0',
+        'GridVerse-Dynamic-Obstacles-5x5-vec-v0',
+        'GridVerse-KeyDoor-5x5-vec-v0',
+    ],
+)
+def test_gym_vec_registration(env_id: str):
+    gym.make(env_id, num_envs=2)
+
+
+def test_gym_vec_control_loop():
+    num_envs = 3
+    env = gym.make('GridVerse-Empty-5x5-vec-v0', num_envs=num_envs)
+    env.seed(1)
+
+    observation = env.reset()
+    assert all(v.shape[0] == num_envs for v in observation.values())
+
+    # no manual reset:  terminated sub-environments reset themselves;  run
+    # until at least one episode terminates so that the autoreset and
+    # terminal-observation path is actually exercised
+    saw_done = False
+    for _ in range(1000):
+        actions = np.array(
+            [env.single_action_space.sample() for _ in range(num_envs)]
+        )
+        observation, reward, done, infos = env.step(actions)
+
+        assert all(v.shape[0] == num_envs for v in observation.values())
+        assert reward.shape == (num_envs,)
+        assert done.shape == (num_envs,)
+        for info, d in zip(infos, done):
+            assert ('terminal_observation' in info) == bool(d)
+
+        if done.any():
+            saw_done = True
+            break
+
+    assert saw_done
+
+
+def test_gym_flat_observation():
+    env = gym.make('GridVerse-Empty-5x5-v0', flat=True)
+
+    assert isinstance(env.observation_space, gym.spaces.Box)
+    assert len(env.observation_space.shape) == 1
+    assert env.observation_space.dtype == np.uint8
+
+    observation = env.reset()
+    assert observation in env.observation_space
+
+    observation, _, _, _ = env.step(env.action_space.sample())
+    assert observation in env.observation_space
+
+
+def test_gym_no_overlap_observation():
+    env = gym.make('GridVerse-Empty-5x5-v0')
+    env.set_observation_representation('no_overlap')
+
+    observation = env.reset()
+    assert observation in env.observation_space
+
+    observation, _, _, _ = env.step(env.action_space.sample())
+    assert observation in env.observation_space
+
+
+def test_gym_async_vec_control_loop():
+    from gym_gridverse.gym import GridVerseAsyncVectorEnv
+
+    num_envs = 2
+    env = GridVerseAsyncVectorEnv('Empty-5x5-v0', num_envs=num_envs)
+
+    try:
+        env.seed(1)
+        observation = env.reset()
+        assert all(v.shape[0] == num_envs for v in observation.values())
+
+        # as in the sync test, run until a sub-environment terminates so
+        # that the autoreset and terminal-observation path is exercised
+        saw_done = False
+        for _ in range(1000):
+            actions = np.array(
+                [env.single_action_space.sample() for _ in range(num_envs)]
+            )
+            observation, reward, done, infos = env.step(actions)
+
+            assert all(v.shape[0] == num_envs for v in observation.values())
+            assert reward.shape == (num_envs,)
+            assert done.shape == (num_envs,)
+            for info, d in zip(infos, done):
+                assert ('terminal_observation' in info) == bool(d)
+
+            if done.any():
+                saw_done = True
+                break
+
+        assert saw_done
+    finally:
+        env.close()
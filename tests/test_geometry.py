@@ -188,6 +188,16 @@ def test_position_from_position_or_tuple(y: int, x: int):
     assert position_from_position == position_from_tuple
 
 
+@pytest.mark.parametrize('y', range(3))
+@pytest.mark.parametrize('x', range(4))
+def test_position_linear_roundtrip(y: int, x: int):
+    width = 4
+    position = Position(y, x)
+    index = position.linear(width)
+    assert index == y * width + x
+    assert Position.from_linear(index, width) == position
+
+
 @pytest.mark.parametrize(
     'pos1,pos2,expected',
     [
@@ -51,6 +51,14 @@ def test_registration(object_type: Type[GridObject], expected: bool):
     assert (object_type in GridObject.object_types) == expected
 
 
+@pytest.mark.parametrize(
+    'object_type', [NoneGridObject, Hidden, Floor, Wall]
+)
+def test_stateless_objects_are_interned(object_type: Type[GridObject]):
+    """ Stateless objects are flyweights;  construction returns the singleton """
+    assert object_type() is object_type()
+
+
 def test_none_grid_object_registration():
     """ Tests the registration as a Grid Object """
     assert NoneGridObject in GridObject.object_types
@@ -113,14 +113,18 @@ def test_grid_positions_inside(grid: Grid, expected: int):
 def test_grid_get_position():
     grid = Grid(3, 4)
 
-    # testing position -> grid_object -> position roundtrip
+    # Floor is an interned flyweight;  fill the grid with distinct objects
+    # for the position -> grid_object -> position roundtrip
+    for position in grid.positions():
+        grid[position] = Key(Color.RED)
+
     for position in grid.positions():
         obj = grid[position]
         assert grid.get_position(obj) == position
 
     # testing exception when object is not in grid
     with pytest.raises(ValueError):
-        grid.get_position(Floor())
+        grid.get_position(Key(Color.BLUE))
 
 
 def test_grid_object_types():
@@ -150,7 +154,7 @@ def test_grid_set_item():
     grid = Grid(3, 4)
 
     pos = Position(0, 0)
-    obj = Floor()
+    obj = Key(Color.RED)
 
     assert grid[pos] is not obj
     grid[pos] = obj
@@ -1,10 +1,7 @@
-import dataclasses
-from copy import deepcopy
-
 import pytest
 
 from gym_gridverse.agent import Agent
-from gym_gridverse.geometry import Orientation
+from gym_gridverse.geometry import Orientation, Position
 from gym_gridverse.grid import Grid
 from gym_gridverse.grid_object import Color, Floor, Key, NoneGridObject, Wall
 from gym_gridverse.state import State
@@ -19,10 +16,11 @@ def _change_grid(state: State):
 
 def _change_agent_position(state: State):
     """changes agent position"""
-    state.agent.position = dataclasses.replace(
-        state.agent.position,
-        y=(state.agent.position.y + 1) % state.grid.height,
-        x=(state.agent.position.x + 1) % state.grid.width,
+    # single combined-index wraparound instead of one modulo per coordinate
+    width = state.grid.width
+    index = state.agent.position.linear(width)
+    state.agent.position = Position.from_linear(
+        (index + width + 1) % (state.grid.height * width), width
     )
 
 
@@ -48,30 +46,46 @@ def _change_agent_object(state: State):
     ],
 )
 def test_state_eq(state: State):
-    other_state = deepcopy(state)
+    other_state = state.copy()
     assert state == other_state
 
-    other_state = deepcopy(state)
+    other_state = state.copy()
     _change_grid(other_state)
     assert state != other_state
 
-    other_state = deepcopy(state)
+    other_state = state.copy()
     _change_agent_position(other_state)
     assert state != other_state
 
-    other_state = deepcopy(state)
+    other_state = state.copy()
     _change_agent_orientation(other_state)
     assert state != other_state
 
-    other_state = deepcopy(state)
+    other_state = state.copy()
     _change_agent_object(other_state)
     assert state != other_state
 
-    other_state = deepcopy(state)
+    other_state = state.copy()
     _change_agent_object(other_state)
     assert state != other_state
 
 
+def test_state_copy():
+    state = State(Grid(2, 3), Agent((0, 0), Orientation.N))
+    other_state = state.copy()
+
+    assert state == other_state
+    assert state is not other_state
+    assert state.grid is not other_state.grid
+    assert state.agent is not other_state.agent
+
+    # changing the copy does not change the original
+    _change_grid(other_state)
+    _change_agent_position(other_state)
+    assert state.grid == Grid(2, 3)
+    assert state.agent == Agent((0, 0), Orientation.N)
+
+
 def test_state_hash():
     wall_position = (0, 0)
     agent_position = (0, 1)